@@ -0,0 +1,127 @@
+// js/tableBundle.js
+// 加载由 `python 物性数据表.py --export` 导出的二进制数据表（修改数据表后重新导出，
+// `python 物性数据表.py --check` 检查已提交的 tables.bin 是否与数据表一致），
+// 各列读入 Float64Array，并提供二分查找的线性插值（单个/批量）。
+const BUNDLE_URL = new URL('../data/tables.bin', import.meta.url);
+const BUNDLE_MAGIC = 'HSQT';
+const BUNDLE_VERSION = 1;
+
+let bundlePromise = null;
+
+// 首次调用时才下载数据表，之后各模块共用同一份结果
+export function loadTables() {
+  if (!bundlePromise) {
+    bundlePromise = fetch(BUNDLE_URL)
+      .then(res => {
+        if (!res.ok) throw new Error(`HTTP ${res.status}`);
+        return res.arrayBuffer();
+      })
+      .then(parseBundle)
+      .catch(err => {
+        bundlePromise = null; // 允许下次重试
+        throw err;
+      });
+  }
+  return bundlePromise;
+}
+
+export async function loadTable(name) {
+  const tables = await loadTables();
+  if (!tables[name]) throw new Error(`数据表 ${name} 不存在`);
+  return tables[name];
+}
+
+// 模块初始化时即开始预取数据表；返回的 getter 在查询时取表。
+// 预取或查询时加载失败都交给 onError 处理，getter 返回 null（下次调用会重新加载）
+export function useTable(name, onError) {
+  loadTable(name).catch(onError);
+  return async () => {
+    try {
+      return await loadTable(name);
+    } catch (err) {
+      onError(err);
+      return null;
+    }
+  };
+}
+
+function parseBundle(buffer) {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== BUNDLE_MAGIC) throw new Error('数据表文件格式错误');
+  const version = view.getUint16(4, true);
+  if (version !== BUNDLE_VERSION) throw new Error(`不支持的数据表版本：${version}`);
+
+  const count = view.getUint16(6, true);
+  const decoder = new TextDecoder();
+  const tables = {};
+  let offset = 8;
+  for (let t = 0; t < count; t++) {
+    const nameLen = view.getUint8(offset);
+    offset += 1;
+    const name = decoder.decode(new Uint8Array(buffer, offset, nameLen));
+    offset += nameLen;
+    const rows = view.getUint16(offset, true);
+    const cols = view.getUint16(offset + 2, true);
+    offset += 4;
+
+    const columns = [];
+    for (let c = 0; c < cols; c++) {
+      const col = new Float64Array(rows);
+      for (let r = 0; r < rows; r++, offset += 8) {
+        col[r] = view.getFloat64(offset, true);
+      }
+      columns.push(col);
+    }
+    tables[name] = { rows, columns };
+  }
+  return tables;
+}
+
+// 二分查找 x 所在区间的左端下标，xs 须单调递增；超出范围（或 NaN）返回 -1
+export function findInterval(xs, x) {
+  const n = xs.length;
+  if (!(x >= xs[0] && x <= xs[n - 1])) return -1;
+  let lo = 0, hi = n - 1;
+  while (hi - lo > 1) {
+    const mid = (lo + hi) >> 1;
+    if (xs[mid] <= x) lo = mid;
+    else hi = mid;
+  }
+  return lo;
+}
+
+// 以第 keyCol 列为自变量，对 cols 中各列插值；超出范围返回 null
+export function interpolate(table, keyCol, x, cols) {
+  const xs = table.columns[keyCol];
+  const i = findInterval(xs, x);
+  if (i < 0) return null;
+  const t = xs[i + 1] === xs[i] ? 0 : (x - xs[i]) / (xs[i + 1] - xs[i]);
+  const out = new Float64Array(cols.length);
+  cols.forEach((c, j) => {
+    const y = table.columns[c];
+    out[j] = c === keyCol ? x : y[i] + (y[i + 1] - y[i]) * t;
+  });
+  return out;
+}
+
+export function interpolateBatch(table, keyCol, values, cols) {
+  return Array.from(values, x => interpolate(table, keyCol, x, cols));
+}
+
+const DECIMAL_RE = /^[+-]?(\d+\.?\d*|\.\d+)(e[+-]?\d+)?$/i;
+
+// 解析粘贴的一列数值（换行、空格、逗号或制表符分隔）；
+// tokens 保留原文，不是有限十进制数的项在 values 中记为 NaN
+export function parseColumn(text) {
+  const tokens = text.split(/[\s,，]+/).filter(Boolean);
+  const values = Float64Array.from(tokens, s => {
+    const v = DECIMAL_RE.test(s) ? parseFloat(s) : NaN;
+    return Number.isFinite(v) ? v : NaN;
+  });
+  return { tokens, values };
+}
+
+export function escapeHtml(text) {
+  return text.replace(/[&<>"']/g, c => `&#${c.charCodeAt(0)};`);
+}